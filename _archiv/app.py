@@ -9,7 +9,7 @@ import asyncio, json, time
 
 from _archiv import db
 from _archiv.matchmaking import MM, Waiter
-from _archiv.game import new_round, evaluate, WIN_AGAINST
+from _archiv.game import schedule_rounds, evaluate, WIN_AGAINST, ROUND_MSG
 
 app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -78,13 +78,10 @@ async def run_game_pair(wsA: WebSocket, wsB: WebSocket, userA: str, userB: str):
         await ws.send_json({"type": "matched", "game_id": game_id, "you": uid, "peer": peer})
 
     # single round MVP
-    prompt = new_round()
+    seed, prompts = schedule_rounds(1)
+    prompt = prompts[0]
     for ws in (wsA, wsB):
-        await ws.send_json({
-            "type": "round",
-            "prompt": prompt,
-            "choices": [c for c in ["R","P","S"] if c != prompt]
-        })
+        await ws.send_text(ROUND_MSG[prompt])
 
     decided = False
     start_ts = time.time()
@@ -142,6 +139,7 @@ async def run_game_pair(wsA: WebSocket, wsB: WebSocket, userA: str, userB: str):
         db.append_log(who, {
             "game_id": game_id,
             "prompt": prompt,
+            "seed": seed,
             "winner_choice": WIN_AGAINST[prompt],
             "decider": uid,
             "your_outcome": outcome,
@@ -2,8 +2,8 @@
 # -----------------------------
 # game.py
 # -----------------------------
-import random, time
-from typing import Tuple
+import json, random, time
+from typing import Optional, Tuple
 
 RPS = ["R", "P", "S"]
 
@@ -16,8 +16,18 @@ WIN_AGAINST = {"R": "P", "P": "S", "S": "R"}
 LOSE_AGAINST = {v: k for k, v in WIN_AGAINST.items()}  # what loses to X
 
 
-def new_round() -> str:
-    return random.choice(RPS)
+# ready-to-send "round" message per prompt
+ROUND_MSG = {
+    p: json.dumps({"type": "round", "prompt": p, "choices": [c for c in RPS if c != p]})
+    for p in RPS
+}
+
+
+def schedule_rounds(n: int, seed: Optional[int] = None) -> Tuple[int, Tuple[str, ...]]:
+    # all prompts of a game in one draw; (seed, n) replays the same prompts
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    return seed, tuple(random.Random(seed).choices(RPS, k=n))
 
 
 def evaluate(prompt: str, choice: str) -> str:
@@ -0,0 +1,36 @@
+"""Stick figure kinematics.
+
+Importing the package does no work: submodules (and numpy, for the
+kinematics) are only loaded when one of their names is first accessed.
+"""
+from importlib import import_module
+
+_LAZY = {
+    "shapes": (
+        "REQ", "EPS", "base_body", "base_proportions",
+        "v1_shape", "v3_shape",
+        "base_figure_v1_sit_uv", "base_figure_v3_sit_uv", "figure_v1_stand_uv",
+        "stickman_v1_16dof_moveto_sit", "stickman_v1_16dof_moveto_stand",
+    ),
+    "export": ("SHAPES", "write_js", "build_stickman"),
+    "kinematics": (
+        "clean_joint_name", "get_dir", "rotated_right", "rotate",
+        "dimToUv", "uvTo3d",
+    ),
+}
+_WHERE = {name: mod for mod, names in _LAZY.items() for name in names}
+
+__all__ = sorted(_WHERE)
+
+
+def __getattr__(name):
+    mod = _WHERE.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
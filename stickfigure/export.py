@@ -0,0 +1,42 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from .shapes import v1_shape, v3_shape
+
+SHAPES = {"v1": v1_shape, "v3": v3_shape}
+
+
+def write_js(name: str, obj: dict, varname: str):
+    js = f"window.{varname} = {json.dumps(obj, ensure_ascii=False)};\n"
+    Path(name).write_text(js, encoding="utf-8")
+
+
+# keyed on a snapshot of the shape, so an edited shape never gets stale tables
+@lru_cache(maxsize=16)
+def _shape_tables(snapshot):
+    req = frozenset(a for a, _ in snapshot) | {c for _, cs in snapshot for c in cs}
+    edges = tuple((a, b) for a, cs in snapshot for b in cs)
+    return req, edges
+
+
+def build_stickman(points: dict, color: str):
+
+    # choose shape
+    if "leftShoulder" in points or "rightShoulder" in points:
+        shape_name = "v3"
+    elif "leftArm" in points or "rightArm" in points:
+        shape_name = "v1"
+    else:
+        raise ValueError("Cannot detect skeleton: need shoulders (v3) or arms (v1).")
+
+    # require all nodes for chosen shape
+    shape = SHAPES[shape_name]
+    req, edges = _shape_tables(tuple((k, tuple(v)) for k, v in shape.items()))
+    miss = sorted(req - set(points))
+    if miss:
+        raise ValueError(f"missing: {miss}")
+
+    v = points
+    lines = [[v[a], v[b]] for a, b in edges]
+    return {"color": color, "lines": lines}
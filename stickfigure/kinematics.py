@@ -0,0 +1,168 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .shapes import base_body, base_proportions, v1_shape
+
+
+# removes "left" or "right"
+@lru_cache(maxsize=None)
+def clean_joint_name(name_in):
+    clean = name_in.lower()
+    for dirt in ["left", "right", "up", "down", "fw", "bw", "out"]:
+        clean = clean.replace(dirt, "")
+    return clean.strip()
+
+
+@lru_cache(maxsize=None)
+def get_dir(key: str):
+    k = key[4:].lower()
+    if any(x in k for x in ["up", "down", "roll"]):
+        return 0  # up/down
+    if any(x in k for x in ["fw", "bw", "forward", "back"]):
+        return 1   # forward/backward
+    if any(x in k for x in ["out", "in", "left", "right"]):
+        return 2   # left/right
+    return None
+
+
+
+def rotated_right(new_up, angle_deg):
+    # normalize input
+    new_up = np.array(new_up, dtype=float)
+    new_up /= np.linalg.norm(new_up)
+
+    # define base vectors
+    old_up = np.array([0, 1, 0], dtype=float)
+    x = np.array([1, 0, 0], dtype=float)  # old right
+
+    # rotation from old_up to new_up
+    axis = np.cross(old_up, new_up)
+    if np.linalg.norm(axis) < 1e-8:
+        rot_to_new_up = np.eye(3)
+    else:
+        axis /= np.linalg.norm(axis)
+        angle = np.arccos(np.clip(np.dot(old_up, new_up), -1, 1))
+        K = np.array([[0, -axis[2], axis[1]],
+                      [axis[2], 0, -axis[0]],
+                      [-axis[1], axis[0], 0]])
+        rot_to_new_up = np.eye(3) + np.sin(angle)*K + (1-np.cos(angle))*(K@K)
+
+    # apply to right vector
+    right = rot_to_new_up @ x
+
+    # rotate around new_up by angle_deg
+    a = np.deg2rad(angle_deg)
+    K2 = np.array([[0, -new_up[2], new_up[1]],
+                   [new_up[2], 0, -new_up[0]],
+                   [-new_up[1], new_up[0], 0]])
+    rot_around_up = np.eye(3) + np.sin(a)*K2 + (1-np.cos(a))*(K2@K2)
+
+    # final right vector
+    new_right = rot_around_up @ right
+    return new_right / np.linalg.norm(new_right)
+
+
+
+def _rodrigues(a, ang):
+    a = np.array(a, float); n = np.linalg.norm(a)
+    if n<1e-12: return np.eye(3)
+    a/=n; x,y,z=a; s,c=np.sin(ang),np.cos(ang)
+    K=np.array([[0,-z,y],[z,0,-x],[-y,x,0]])
+    return np.eye(3)+s*K+(1-c)*(K@K)
+
+
+# spine frame only depends on (spine, rotation): dimToUv asks for the same one for every joint
+@lru_cache(maxsize=256)
+def _frame(spine, rotation):
+    old_up=np.array([0,1,0.]); spine=np.array(spine,float); spine/=np.linalg.norm(spine)
+    axis=np.cross(old_up,spine); ang=np.arccos(np.clip(np.dot(old_up,spine),-1,1))
+    R_up2sp=_rodrigues(axis,ang)
+    R_yaw=_rodrigues(spine, np.deg2rad(rotation))
+    R_frame=R_yaw@R_up2sp
+    R_frame.flags.writeable = False
+    return R_frame
+
+
+def rotate(old_vec, spine, rotation, transformation):
+    R_frame=_frame(tuple(float(s) for s in spine), float(rotation))
+    v_local=R_frame.T@np.array(old_vec,float)
+
+    # order: up/down (about local x), fw/bw (about local z), left/right (about local y)
+    ud,fb,lr=[np.deg2rad(a) for a in (transformation+[0,0,0])[:3]]
+    # convention tweak: negative ud = tilt down
+    Rx=np.array([[1,0,0],[0,np.cos(-ud),-np.sin(-ud)],[0,np.sin(-ud),np.cos(-ud)]])
+    Rz=np.array([[np.cos(fb),-np.sin(fb),0],[np.sin(fb),np.cos(fb),0],[0,0,1]])
+    Ry=np.array([[np.cos(lr),0,np.sin(lr)],[0,1,0],[-np.sin(lr),0,np.cos(lr)]])
+    v_local2=Ry@Rz@Rx@v_local
+    new_vec = R_frame @ v_local2
+    new_vec = new_vec / np.linalg.norm(new_vec)
+    return new_vec
+
+
+# which figure key drives which base joint, built once per (figure keys, base keys) layout
+@lru_cache(maxsize=64)
+def _dof_slots(figure_keys, base_keys):
+    slots = []
+    for base_key in base_keys:
+        slot = None
+        for new_key in figure_keys:
+            slot = None  # same as before: t is reset for every figure key
+            if new_key not in ["base", "neck", "rotation"]:
+                if clean_joint_name(new_key) in base_key:
+                    slot = (new_key, get_dir(new_key))
+        slots.append((base_key, slot))
+    return tuple(slots)
+
+
+def dimToUv(figure, base_figure, debug=False):
+    uv_figure = {
+        "base": figure["base"],
+        "neck": figure["neck"]
+    }
+    for base_key, slot in _dof_slots(tuple(figure), tuple(base_figure)):
+        if debug:
+            print(f"base key: {base_key}")
+            print(f"slot: {slot}")
+        t = [0,0,0]
+        if slot is not None:
+            new_key, d = slot
+            t[d] = figure[new_key]
+        uv_figure[base_key] = rotate(base_figure[base_key], base_figure["neck"], figure["rotation"], t)
+    uv_figure = {k: np.nan_to_num(v).tolist() for k, v in uv_figure.items()}
+    return uv_figure
+
+
+# getestet für v1
+def uvTo3d(uv_figure, body_shape=None, body=None, proportions=None, orig=None, debug=False):
+    if orig is None:
+        orig = [0,0,0]
+    if proportions is None:
+        proportions = base_proportions
+    if body is None:
+        body = base_body
+    if body_shape is None:
+        body_shape = v1_shape
+    uv_figure["orig"] = orig
+    body_3d = {
+        "base": uv_figure["base"]
+    }
+    for i in body_shape.keys():
+        if debug:
+            print(f"i is {i}")
+        for j in body_shape[i]:
+            if debug:
+                print(f"    j is {j}")
+                for n in uv_figure[j]:
+                    print(f"        n is {n}")
+            bone_len = float(proportions[clean_joint_name(i)][clean_joint_name(j)]) / proportions["div"] * float(body["height"])
+            body_3d[j] = [body_3d[i][n] + uv_figure[j][n] * bone_len for n in range(3)]
+    return body_3d
+
+
+"""
+# todo:
+ausrichtung komplett von situation trennen
+
+
+"""
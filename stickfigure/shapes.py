@@ -0,0 +1,140 @@
+# pure data, no numpy: safe to import from a game server worker
+REQ = {"Fuss_L", "Fuss_R", "Hüfte", "Hals", "Kopf", "Hand_L", "Hand_R"}
+EPS = 1e-6
+
+
+# für alle
+base_body = {
+    "height": 1.50
+}
+base_proportions = {
+    "div": 7.5,  # the face is about 2/15 of the body height
+    "base": {
+        "neck": 2.5,
+        "leg": 2.5,
+        "hip": 0.5
+    },
+    "neck": {
+        "head": 1.5,  # head=forehead
+        "shoulder": 1,
+        "arm": 3  # middle of forearm
+    },
+    "hip": {
+        "knee": 1.5,
+    },
+    "knee": {
+        "foot": 2  # foot=ankle
+    },
+    "head": {
+        "chin": 1
+    },
+    "shoulder": {
+        "elbow": 1.5
+    },
+    "elbow": {
+        "hand": 1.5  # hand=wrist
+    },
+    "foot": {
+        "toe": 1
+    },
+    "hand": {
+        "finger": 0.5  # fingers a little bent
+    }
+}
+
+
+# v3
+v3_shape = {
+    "base": ["neck", "leftHip", "rightHip"],
+    "neck": ["head", "leftShoulder", "rightShoulder"],
+    "head": ["chin"],
+    "leftShoulder": ["leftElbow"],
+    "leftElbow": ["leftHand"],
+    "leftHand": ["leftFinger"],
+    "leftHip": ["leftKnee"],
+    "leftKnee": ["leftFoot"],
+    "leftFoot": ["leftToe"],
+    "rightShoulder": ["rightElbow"],
+    "rightElbow": ["rightHand"],
+    "rightHand": ["rightFinger"],
+    "rightHip": ["rightKnee"],
+    "rightKnee": ["rightFoot"],
+    "rightFoot": ["rightToe"]
+}
+base_figure_v3_sit_uv = {
+    "base": [0, 0, 0],
+    "neck": [-0.70710678118, 0.70710678118, 0],
+    "head": [-0.342, 0.94, 0],
+    "chin": [-0.70710678118, 0.70710678118, 0],
+    "leftHip": [0, 0, 1],
+    "rightHip": [0, 0, -1],
+    "leftShoulder": [0, 0, 1],
+    "rightShoulder": [0, 0, -1],
+    "leftElbow": [0.70710678118, 0, 0.70710678118],
+    "rightElbow": [0.70710678118, 0, -0.70710678118],
+    "leftHand": [0.70710678118, 0.70710678118, 0],
+    "rightHand": [0.70710678118, 0.70710678118, 0],
+    "leftFinger": [0.70710678118, 0.70710678118, 0],
+    "rightFinger": [0.70710678118, 0.70710678118, 0],
+    "leftKnee": [-0.3333333333, 0.3333333333, 0.3333333333],
+    "rightKnee": [0.3333333333, 0.3333333333, 0.3333333333],
+    "rightFoot": [0.70710678118, -0.70710678118, 0],
+    "leftFoot": [0.70710678118, -0.70710678118, 0],
+    "leftToe": [0.70710678118, 0.70710678118, 0],
+    "rightToe": [0.70710678118, 0.70710678118, 0]
+}
+
+# v1
+v1_shape = {
+    "base": ["neck", "leftLeg", "rightLeg"],
+    "neck": ["head", "leftArm", "rightArm"]
+}
+figure_v1_stand_uv = {
+    "base": [0, 1, 0],          #flies probably!
+    "neck": [0, 1, 0],
+    "leftLeg": [-0.342, -0.94, 0],
+    "rightLeg": [0.342, -0.94, 0],
+    "head": [0, 1, 0],
+    "leftArm": [0, 0, 1],
+    "rightArm": [0, 0, -1]
+}
+
+base_figure_v1_sit_uv = {
+    "base": [0, 0, 0],
+    "neck": [-0.70710678118, 0.70710678118, 0],
+    "head": [-0.70710678118, 0.70710678118, 0],
+    "leftArm": [0, 0.70710678118, 0.70710678118],
+    "rightArm": [0, 0.70710678118, -0.70710678118],
+    "leftLeg": [0.70710678118, 0, 0.70710678118],
+    "rightLeg": [0.70710678118, 0, -0.70710678118]
+}
+
+stickman_v1_16dof_moveto_sit = {
+    "base": [0, 0, 0],
+    "neck": [0, 0, 0],
+    "rotation": 0,
+    "headRoll": 0,
+    "leftArmUpDown": 0,
+    "leftArmFwBw": 0,
+    "rightArmUpDown": 0,
+    "rightArmFwBw": 0,
+    "leftLegOut": 0,
+    "leftLegFwBw": 0,
+    "rightLegOut": 0,
+    "rightLegFwBw": 0
+}
+
+stickman_v1_16dof_moveto_stand = {
+    "base": [0, 1, 0], # problem Y: ev. kollision mit MATTE
+    "neck": [0, 1, 0],
+    "rotation": 0,
+    "headRoll": 0,
+    "leftArmUpDown": -90,
+    "leftArmFwBw": 0,
+    "rightArmUpDown": -90,
+    "rightArmFwBw": 0,
+    "leftLegOut": -10,
+    "leftLegFwBw": -90,
+    "rightLegOut": -10,
+    "rightLegFwBw": -90
+}
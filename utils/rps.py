@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import json
 import random
 
 RPS = ["R", "P", "S"]
@@ -7,6 +9,11 @@ WINS = {("R","S"), ("P","R"), ("S","P")}
 EMOJI = {"R": "🪨", "P": "📄", "S": "✂️"}
 WORD_DE = {"R": "Stein", "P": "Papier", "S": "Schere"}
 
+# center -> the choice that beats it
+WINNER = {center: attacker for attacker, center in WINS}
+_NO_WINNER = object()  # default for unknown centers, never equal to a choice
+STYLES = ("emoji", "text", "desc", "img")
+
 def new_center(symbols: List[str]=None) -> str:
     return random.choice(symbols or RPS)
 
@@ -14,9 +21,9 @@ def other_two(center: str) -> List[str]:
     return [x for x in RPS if x != center]
 
 def evaluate(attacker_choice: str, center: str) -> bool:
-    return (attacker_choice, center) in WINS
+    return WINNER.get(center, _NO_WINNER) == attacker_choice
 
-def pretty(symbol: str, style: str) -> Tuple[str, str]:
+def _render(symbol: str, style: str) -> Tuple[str, str]:
     if style == "emoji":
         return "emoji", EMOJI[symbol]
     if style == "text":
@@ -25,4 +32,97 @@ def pretty(symbol: str, style: str) -> Tuple[str, str]:
         return "word_de", WORD_DE[symbol]
     if style == "img":
         return "letter", symbol
-    return "letter", symbol
\ No newline at end of file
+    return "letter", symbol
+
+_PRETTY = {style: {s: _render(s, style) for s in RPS} for style in STYLES}
+
+def pretty(symbol: str, style: str) -> Tuple[str, str]:
+    try:
+        return _PRETTY[style][symbol]
+    except KeyError:
+        return _render(symbol, style)
+
+
+@dataclass(frozen=True)
+class Prompt:
+    center: str
+    choices: Tuple[str, str]
+    winning: str
+    center_label: Tuple[str, str]
+    choice_labels: Tuple[Tuple[str, str], Tuple[str, str]]
+
+
+def _build_prompts(style: str) -> Dict[str, Prompt]:
+    table = {}
+    for center in RPS:
+        a, b = other_two(center)
+        table[center] = Prompt(
+            center=center,
+            choices=(a, b),
+            winning=WINNER[center],
+            center_label=pretty(center, style),
+            choice_labels=(pretty(a, style), pretty(b, style)),
+        )
+    return table
+
+_PROMPTS = {style: _build_prompts(style) for style in STYLES}
+
+
+def prompt_table(style: str) -> Dict[str, Prompt]:
+    """Everything a round needs per center symbol, rendered once per display style."""
+    try:
+        return _PROMPTS[style]
+    except KeyError:
+        raise ValueError(f"style must be one of {STYLES}, got {style!r}") from None
+
+
+ROUND_FIELDS = frozenset({"type", "round", "situation", "option1", "option2"})
+
+
+def _round_message(n: int, p: Prompt) -> str:
+    return json.dumps({
+        "type": "round",
+        "round": n,
+        "situation": p.center_label[1],
+        "option1": p.choice_labels[0][1],
+        "option2": p.choice_labels[1][1],
+    }, ensure_ascii=False)
+
+
+class RoundSchedule:
+    """All prompts of a match, drawn up front from one seed.
+
+    The same (seed, rounds, style, symbols) always gives the same schedule, so
+    storing the seed is enough to replay or audit a match.
+    """
+
+    def __init__(self, rounds: int, seed: Optional[int]=None, style: str="text",
+                 symbols: List[str]=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.style = style
+        symbols = symbols or RPS
+        unknown = set(symbols) - set(RPS)
+        if unknown:
+            raise ValueError(f"symbols must be from {RPS}, got {sorted(unknown)}")
+        table = prompt_table(style)
+        centers = random.Random(seed).choices(symbols, k=rounds)
+        self.prompts: Tuple[Prompt, ...] = tuple(table[c] for c in centers)
+        # encoded without the closing brace, so per-player fields can be appended
+        self._heads = tuple(_round_message(i + 1, p)[:-1] for i, p in enumerate(self.prompts))
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def __getitem__(self, i: int) -> Prompt:
+        return self.prompts[i]
+
+    def message(self, i: int, **extra) -> str:
+        """Encoded "round" message for round i (0-based), plus optional extra fields."""
+        if not extra:
+            return self._heads[i] + "}"
+        clash = ROUND_FIELDS & extra.keys()
+        if clash:
+            raise ValueError(f"fields already in the round message: {sorted(clash)}")
+        return self._heads[i] + ", " + json.dumps(extra, ensure_ascii=False)[1:]